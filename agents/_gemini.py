@@ -0,0 +1,15 @@
+"""Shared Gemini call helper for the agents."""
+
+from __future__ import annotations
+
+from typing import Any, Optional
+
+
+def generate_content(model: Any, prompt: str, timeout: Optional[float] = None) -> Any:
+    """
+    Call model.generate_content, bounding the HTTP request when a timeout is given so a call
+    abandoned by the orchestrator still ends. request_options is only passed when needed.
+    """
+    if timeout:
+        return model.generate_content(prompt, request_options={"timeout": timeout})
+    return model.generate_content(prompt)
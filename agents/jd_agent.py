@@ -3,11 +3,12 @@ from __future__ import annotations
 import logging
 import json
 import re
-from typing import Dict
+from typing import Dict, Optional
 from dotenv import load_dotenv
 import os
 import google.generativeai as genai
 
+from agents._gemini import generate_content
 from memory.session_state import SessionState
 from tools.keyword_extractor import KeywordExtractor
 
@@ -39,12 +40,20 @@ def _extract_json(text: str) -> Dict:
 class JobDescriptionAgent:
     """Agent that processes job descriptions via Gemini and keyword extraction."""
 
-    def __init__(self, session: SessionState, model: str = "models/gemini-2.5-flash") -> None:
+    def __init__(
+        self,
+        session: SessionState,
+        model: str = "models/gemini-2.5-flash",
+        request_timeout: Optional[float] = None,
+        use_gemini: bool = True,
+    ) -> None:
         self.session = session
         self.model_name = model
+        self.request_timeout = request_timeout
         self.keyword_extractor = KeywordExtractor()
-        self.gemini_enabled = API_KEY is not None
-        if not self.gemini_enabled:
+        # use_gemini=False gives keyword-only extraction (the orchestrator's timeout fallback).
+        self.gemini_enabled = use_gemini and API_KEY is not None
+        if use_gemini and API_KEY is None:
             logger.warning("GOOGLE_API_KEY not found; JD Agent will not call Gemini API.")
 
     def run(self, jd_text: str) -> Dict:
@@ -76,7 +85,7 @@ class JobDescriptionAgent:
                 f"Job Description:\n{jd_text}\n\n"
                 "Return ONLY valid JSON. Example: {\"skills\": [...], \"years_experience\": 2, \"summary\": \"...\"}"
             )
-            response = model.generate_content(prompt)
+            response = generate_content(model, prompt, self.request_timeout)
             raw = response.text or ""
             return _extract_json(raw)
         except Exception as exc:
@@ -1,11 +1,16 @@
 from tools.pdf_parser import ResumeParser
 
 class ResumeParserAgent:
-    def __init__(self, session):
+    def __init__(self, session, timeout=None):
         self.session = session
+        # When set, parsing runs in a child process that is killed after this many seconds.
+        self.timeout = timeout
 
     def run(self, resume_bytes):
-        text = ResumeParser.parse(resume_bytes)
+        if self.timeout is None:
+            text = ResumeParser.parse(resume_bytes)
+        else:
+            text = ResumeParser.parse_with_timeout(resume_bytes, self.timeout)
 
         if text == "UNSUPPORTED_FILE_TYPE":
             raise ValueError("Only PDF or DOCX resume formats are supported.")
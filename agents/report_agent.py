@@ -2,10 +2,11 @@ from __future__ import annotations
 
 import logging
 import os
-from typing import Dict
+from typing import Dict, Optional
 from dotenv import load_dotenv
 import google.generativeai as genai
 
+from agents._gemini import generate_content
 from memory.session_state import SessionState
 from tools.scoring_engine import MatchBreakdown
 
@@ -28,10 +29,18 @@ def _extract_text(response) -> str:
 class ReportAgent:
     """Generates clean HR-style report WITHOUT ATS section (UI handles that)."""
 
-    def __init__(self, session: SessionState, model="models/gemini-2.5-flash"):
+    def __init__(
+        self,
+        session: SessionState,
+        model="models/gemini-2.5-flash",
+        request_timeout: Optional[float] = None,
+        use_gemini: bool = True,
+    ):
         self.session = session
         self.model = model
-        self.enabled = API_KEY is not None
+        self.request_timeout = request_timeout
+        # use_gemini=False skips the narrative and keeps only the skill gap.
+        self.enabled = use_gemini and API_KEY is not None
 
     def run(self) -> Dict[str, str]:
         resume = self.session.get("resume_features", {})
@@ -39,10 +48,12 @@ class ReportAgent:
         breakdown: MatchBreakdown = self.session.get("score_breakdown")
 
         narrative = self._generate(resume, jd, breakdown)
-        return {
+        report = {
             "summary": narrative,
             "skill_gap": self._skill_gap(resume, jd)
         }
+        self.session.set("report", report)
+        return report
 
     def _generate(self, resume, jd, breakdown):
         fallback = "Unable to generate report."
@@ -94,7 +105,7 @@ Resume Skills: {resume.get('skills', [])}
 Job Skills: {jd.get('skills', [])}
 """
 
-            resp = model.generate_content(prompt)
+            resp = generate_content(model, prompt, self.request_timeout)
             return _extract_text(resp).strip() or fallback
 
         except Exception as e:
@@ -6,8 +6,11 @@ from __future__ import annotations
 
 import concurrent.futures
 import logging
+import queue
+import threading
+import time
 from pathlib import Path
-from typing import Iterable, List
+from typing import Any, Callable, Dict, Iterable, List, Optional, Protocol, Tuple
 
 from agents.jd_agent import JobDescriptionAgent
 from agents.parser_agent import ResumeParserAgent
@@ -22,32 +25,324 @@ logging.basicConfig(
 )
 logger = logging.getLogger("app")
 
+# Per-resume status values stored under the "status" session key.
+STATUS_OK = "ok"
+STATUS_DEGRADED = "degraded"
+STATUS_TIMED_OUT = "timed_out"
+STATUS_CANCELLED = "cancelled"
+STATUS_FAILED = "failed"
 
-def run_pipeline(resume_source: Path | bytes, jd_text: str) -> SessionState:
+# Default time budget (seconds) for each pipeline stage.
+# Stages in LOCAL_STAGES are only bounded by their own budget, never by the batch deadline,
+# so a resume whose remote stages degraded at the deadline can still be scored.
+DEFAULT_STAGE_TIMEOUTS: Dict[str, float] = {
+    "parse": 20.0,
+    "skills": 30.0,
+    "jd": 30.0,
+    "score": 5.0,
+    "report": 45.0,
+}
+LOCAL_STAGES = frozenset({"score"})
+
+# Worker count and queue size for process_resume_stream; up to 2 * this + 1 resumes are held
+# in memory at once (one per worker, one per queue slot and the one being read).
+DEFAULT_MAX_IN_FLIGHT = 4
+
+# Extra time given to in-flight resumes after the batch deadline so they can finish degrading.
+DEADLINE_GRACE_SECONDS = 0.5
+
+
+class StageTimeout(TimeoutError):
+    """Raised when a pipeline stage exceeds its time budget."""
+
+
+class NamedUpload(Protocol):
+    """Anything with a name and a read() returning resume bytes (uploads, archive members)."""
+
+    name: str
+
+    def read(self) -> bytes: ...
+
+
+def _status_session(status: str, error: str) -> SessionState:
+    """Build a session for a resume that never ran through the pipeline."""
+    session = SessionState()
+    session.set("status", status)
+    session.set("error", error)
+    return session
+
+
+def _call_with_timeout(fn: Callable[[], Any], timeout: Optional[float]) -> Any:
     """
-    Execute sequential multi-agent pipeline for a single resume.
+    Run fn in a daemon thread and wait at most timeout seconds for it.
+    A stage that overruns is abandoned rather than killed, so it must not share mutable state and
+    should bound its own blocking calls (the Gemini stages pass the budget as a request timeout).
     """
-    session = SessionState()
-    # Sequential hand-off between agents ensures deterministic flow.
-    ResumeParserAgent(session).run(resume_source)
-    SkillExtractionAgent(session).run()
-    JobDescriptionAgent(session).run(jd_text)
-    ScoringAgent(session).run()
-    ReportAgent(session).run()
+    if timeout is None:
+        return fn()
+    if timeout <= 0:
+        raise StageTimeout("no time left")
+
+    outcome: Dict[str, Any] = {}
+
+    def target() -> None:
+        try:
+            outcome["value"] = fn()
+        except BaseException as exc:  # re-raised in the calling thread
+            outcome["error"] = exc
+
+    worker = threading.Thread(target=target, daemon=True)
+    worker.start()
+    worker.join(timeout)
+    if worker.is_alive():
+        raise StageTimeout(f"exceeded {timeout:.1f}s")
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome.get("value")
+
+
+class _PipelineRun:
+    """Runs the agents for one resume under a deadline and per-stage budgets."""
+
+    def __init__(self, deadline_at: Optional[float], stage_timeouts: Dict[str, float]) -> None:
+        self.session = SessionState()
+        self.deadline_at = deadline_at
+        self.stage_timeouts = stage_timeouts
+        self.stage_status: Dict[str, str] = {}
+        self.session.set("stage_status", self.stage_status)
+
+    def _budget(self, stage: str) -> Optional[float]:
+        """Return the seconds available to a stage, bounded by the overall deadline unless it is local."""
+        budget = self.stage_timeouts.get(stage)
+        if self.deadline_at is None or stage in LOCAL_STAGES:
+            return budget
+        remaining = self.deadline_at - time.monotonic()
+        return remaining if budget is None else min(budget, remaining)
+
+    def stage(
+        self,
+        name: str,
+        run: Callable[[SessionState, Optional[float]], Any],
+        fallback: Optional[Callable[[SessionState], Any]] = None,
+        self_timed: bool = False,
+    ) -> None:
+        """
+        Execute one stage against a scratch copy of the session and merge it on success.
+        run receives the stage budget so remote calls can time out themselves once abandoned.
+        A self_timed stage enforces the budget itself (raising TimeoutError) instead of running in
+        an abandonable thread.
+        On timeout the fallback (if any) runs without a budget; otherwise StageTimeout propagates.
+        """
+        scratch = SessionState(dict(self.session.data))
+        budget = self._budget(name)
+        try:
+            if not self_timed:
+                _call_with_timeout(lambda: run(scratch, budget), budget)
+            elif budget is not None and budget <= 0:
+                raise StageTimeout("no time left")
+            else:
+                run(scratch, budget)
+        except TimeoutError as exc:
+            if fallback is None:
+                self.stage_status[name] = STATUS_TIMED_OUT
+                raise StageTimeout(f"{name} stage {exc}") from None
+            logger.warning("Stage %s %s; degrading", name, exc)
+            scratch = SessionState(dict(self.session.data))
+            try:
+                fallback(scratch)
+            except Exception:
+                self.stage_status[name] = STATUS_FAILED
+                raise
+            self.stage_status[name] = STATUS_DEGRADED
+        except Exception:
+            self.stage_status[name] = STATUS_FAILED
+            raise
+        else:
+            self.stage_status[name] = STATUS_OK
+        self.session.data.update(scratch.data)
+        self.session.set("stage_status", self.stage_status)
+
+
+def _keyword_only_skills(session: SessionState) -> None:
+    SkillExtractionAgent(session, use_gemini=False).run()
+
+
+def _keyword_only_jd(session: SessionState, jd_text: str) -> None:
+    JobDescriptionAgent(session, use_gemini=False).run(jd_text)
+
+
+def _report_without_narrative(session: SessionState) -> None:
+    ReportAgent(session, use_gemini=False).run()
+
+
+def _run_pipeline_until(
+    resume_source: Path | bytes,
+    jd_text: str,
+    deadline_at: Optional[float],
+    stage_timeouts: Dict[str, float],
+) -> SessionState:
+    """Run all stages for one resume and record a status instead of raising."""
+    run = _PipelineRun(deadline_at, stage_timeouts)
+    session = run.session
+    if deadline_at is not None and time.monotonic() >= deadline_at:
+        session.set("status", STATUS_CANCELLED)
+        session.set("error", "Batch deadline reached before processing started.")
+        return session
+
+    try:
+        # Sequential hand-off between agents ensures deterministic flow.
+        # Parsing runs in a child process that is terminated on overrun, so nothing is left behind.
+        run.stage("parse", lambda s, t: ResumeParserAgent(s, timeout=t).run(resume_source), self_timed=True)
+        run.stage("skills", lambda s, t: SkillExtractionAgent(s, request_timeout=t).run(), _keyword_only_skills)
+        run.stage(
+            "jd",
+            lambda s, t: JobDescriptionAgent(s, request_timeout=t).run(jd_text),
+            lambda s: _keyword_only_jd(s, jd_text),
+        )
+        run.stage("score", lambda s, _: ScoringAgent(s).run())
+        run.stage("report", lambda s, t: ReportAgent(s, request_timeout=t).run(), _report_without_narrative)
+    except StageTimeout as exc:
+        logger.warning("Resume timed out: %s", exc)
+        session.set("status", STATUS_TIMED_OUT)
+        session.set("error", str(exc))
+        return session
+    except Exception as exc:
+        logger.error("Resume processing failed: %s", exc)
+        session.set("status", STATUS_FAILED)
+        session.set("error", str(exc))
+        return session
+
+    degraded = STATUS_DEGRADED in run.stage_status.values()
+    session.set("status", STATUS_DEGRADED if degraded else STATUS_OK)
     return session
 
 
-def process_multiple_resumes(resume_sources: Iterable[Path | bytes], jd_text: str) -> List[SessionState]:
+def _resolve_stage_timeouts(stage_timeouts: Optional[Dict[str, float]]) -> Dict[str, float]:
+    """Overlay caller budgets on the defaults; a value of None disables that stage's budget."""
+    merged = dict(DEFAULT_STAGE_TIMEOUTS)
+    merged.update(stage_timeouts or {})
+    return merged
+
+
+def run_pipeline(
+    resume_source: Path | bytes,
+    jd_text: str,
+    deadline: Optional[float] = None,
+    stage_timeouts: Optional[Dict[str, float]] = None,
+) -> SessionState:
+    """
+    Execute sequential multi-agent pipeline for a single resume.
+    deadline is an overall budget in seconds; the outcome is stored under the "status" session key.
+    """
+    deadline_at = None if deadline is None else time.monotonic() + deadline
+    return _run_pipeline_until(resume_source, jd_text, deadline_at, _resolve_stage_timeouts(stage_timeouts))
+
+
+def process_multiple_resumes(
+    resume_sources: Iterable[Path | bytes],
+    jd_text: str,
+    deadline: Optional[float] = None,
+    stage_timeouts: Optional[Dict[str, float]] = None,
+) -> List[SessionState]:
     """
     Process multiple resumes in parallel using thread pool execution.
+    Returns one session per source, in order, even when the deadline cuts the batch short.
     """
     sources = list(resume_sources)
+    timeouts = _resolve_stage_timeouts(stage_timeouts)
+    deadline_at = None if deadline is None else time.monotonic() + deadline
+
     # ThreadPoolExecutor keeps CPU-bound scoring responsive for multiple resumes.
-    with concurrent.futures.ThreadPoolExecutor() as executor:
-        results = list(executor.map(lambda src: run_pipeline(src, jd_text), sources))
+    executor = concurrent.futures.ThreadPoolExecutor()
+    try:
+        futures = [
+            executor.submit(_run_pipeline_until, src, jd_text, deadline_at, timeouts)
+            for src in sources
+        ]
+        wait_for = None if deadline_at is None else max(deadline_at - time.monotonic(), 0) + DEADLINE_GRACE_SECONDS
+        concurrent.futures.wait(futures, timeout=wait_for)
+
+        results: List[SessionState] = []
+        for future in futures:
+            if future.done() and not future.cancelled():
+                results.append(future.result())
+                continue
+            # Queued work is dropped; running work is abandoned and reported as timed out.
+            status = STATUS_CANCELLED if future.cancel() else STATUS_TIMED_OUT
+            results.append(_status_session(status, "Batch deadline reached."))
+    finally:
+        # Do not block on hung workers; cancel anything still queued.
+        executor.shutdown(wait=False, cancel_futures=True)
     return results
 
 
+def process_resume_stream(
+    uploads: Iterable[NamedUpload],
+    jd_text: str,
+    deadline: Optional[float] = None,
+    stage_timeouts: Optional[Dict[str, float]] = None,
+    max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+) -> List[Tuple[str, SessionState]]:
+    """
+    Read uploads one at a time and feed them to worker threads through a bounded queue.
+    At most 2 * max_in_flight + 1 resumes are held in memory at once, however long the stream is.
+    Returns (name, session) pairs in input order; read errors are reported as failed resumes.
+    """
+    if max_in_flight < 1:
+        raise ValueError("max_in_flight must be at least 1")
+    timeouts = _resolve_stage_timeouts(stage_timeouts)
+    deadline_at = None if deadline is None else time.monotonic() + deadline
+    pending: "queue.Queue[Optional[Tuple[int, str, bytes]]]" = queue.Queue(maxsize=max_in_flight)
+    results: Dict[int, Tuple[str, SessionState]] = {}
+    names: List[str] = []
+
+    def worker() -> None:
+        while True:
+            item = pending.get()
+            if item is None:
+                return
+            index, name, payload = item
+            del item
+            results[index] = (name, _run_pipeline_until(payload, jd_text, deadline_at, timeouts))
+            del payload
+
+    workers = [threading.Thread(target=worker, daemon=True) for _ in range(max_in_flight)]
+    for thread in workers:
+        thread.start()
+
+    try:
+        for index, upload in enumerate(uploads):
+            names.append(upload.name)
+            remaining = None if deadline_at is None else deadline_at - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                results[index] = (upload.name, _status_session(STATUS_CANCELLED, "Batch deadline reached."))
+                continue
+            try:
+                payload = upload.read()
+            except Exception as exc:
+                logger.error("Could not read %s: %s", upload.name, exc)
+                results[index] = (upload.name, _status_session(STATUS_FAILED, str(exc)))
+                continue
+            try:
+                # Blocks while max_in_flight resumes are already waiting, which throttles decompression.
+                pending.put((index, upload.name, payload), timeout=remaining)
+            except queue.Full:
+                results[index] = (upload.name, _status_session(STATUS_CANCELLED, "Batch deadline reached."))
+            del payload
+    finally:
+        # Always release the workers, even if the upload iterator itself raises.
+        for _ in workers:
+            pending.put(None)
+    # One absolute grace deadline for all workers, so the overrun does not grow with max_in_flight.
+    grace_at = None if deadline_at is None else deadline_at + DEADLINE_GRACE_SECONDS
+    for thread in workers:
+        thread.join(None if grace_at is None else max(grace_at - time.monotonic(), 0))
+
+    return [
+        results.get(index) or (name, _status_session(STATUS_TIMED_OUT, "Batch deadline reached."))
+        for index, name in enumerate(names)
+    ]
+
+
 if __name__ == "__main__":
     logger.info("Smart Resume → Job Match AI Agent orchestrator ready.")
-
@@ -0,0 +1,125 @@
+"""Size and zip-bomb guards of the streaming resume archive reader."""
+
+from __future__ import annotations
+
+import io
+import random
+import zipfile
+
+import pytest
+
+from tools.archive_reader import ArchiveLimitError, IngestLimits, LimitedUpload, ResumeArchive
+
+
+def make_zip(files, compression=zipfile.ZIP_DEFLATED) -> io.BytesIO:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", compression) as archive:
+        for name, data in files.items():
+            archive.writestr(name, data)
+    buffer.seek(0)
+    return buffer
+
+
+def read_all(archive: ResumeArchive):
+    """Map member name to bytes, or to the ArchiveLimitError raised while reading it."""
+    results = {}
+    for member in archive.members():
+        try:
+            results[member.name] = member.read()
+        except ArchiveLimitError as exc:
+            results[member.name] = exc
+    return results
+
+
+def test_members_skip_folders_metadata_and_unsupported_files():
+    source = make_zip({"a.pdf": b"pdf", "dir/": b"", "__MACOSX/._a.pdf": b"x", ".hidden.pdf": b"x", "notes.txt": b"x"})
+    with ResumeArchive(source) as archive:
+        assert read_all(archive) == {"a.pdf": b"pdf"}
+
+
+def test_rejects_compression_ratio_bomb():
+    source = make_zip({"bomb.pdf": b"\0" * 2_000_000, "ok.pdf": b"resume"})
+    with ResumeArchive(source) as archive:
+        results = read_all(archive)
+    assert "compression ratio" in str(results["bomb.pdf"])
+    assert results["ok.pdf"] == b"resume"
+
+
+def test_rejects_file_over_per_file_limit():
+    source = make_zip({"big.pdf": b"x" * 2000, "ok.pdf": b"resume"}, compression=zipfile.ZIP_STORED)
+    with ResumeArchive(source, IngestLimits(max_file_bytes=1000)) as archive:
+        results = read_all(archive)
+    assert "file limit" in str(results["big.pdf"])
+    assert results["ok.pdf"] == b"resume"
+
+
+def test_rejects_archive_over_total_limit():
+    files = {f"r{i}.pdf": b"x" * 400 for i in range(5)}
+    source = make_zip(files, compression=zipfile.ZIP_STORED)
+    with ResumeArchive(source, IngestLimits(max_total_bytes=1000)) as archive:
+        results = read_all(archive)
+    assert results["r0.pdf"] == results["r1.pdf"] == b"x" * 400
+    for name in ("r2.pdf", "r3.pdf", "r4.pdf"):
+        assert "total limit" in str(results[name])
+
+
+def test_rejects_too_many_members():
+    with pytest.raises(ArchiveLimitError):
+        ResumeArchive(make_zip({f"r{i}.pdf": b"x" for i in range(5)}), max_members=3)
+
+
+def test_rejects_encrypted_member():
+    with ResumeArchive(make_zip({"secret.pdf": b"resume"})) as archive:
+        archive.zip.getinfo("secret.pdf").flag_bits |= 0x1
+        results = read_all(archive)
+    assert "encrypted" in str(results["secret.pdf"])
+
+
+def test_rejects_docx_with_compressed_bomb_inside():
+    docx = make_zip({"word/document.xml": b"<w/>" * 500_000}).getvalue()
+    source = make_zip({"resume.docx": docx}, compression=zipfile.ZIP_STORED)
+    with ResumeArchive(source) as archive:
+        results = read_all(archive)
+    assert "compression ratio" in str(results["resume.docx"])
+
+
+def compressible_part(size: int, seed: int) -> bytes:
+    """About 50:1 compressible, so it stays under the 100:1 ratio limit."""
+    return random.Random(seed).randbytes(size // 50) + b"\0" * (size - size // 50)
+
+
+def test_rejects_docx_whose_parts_together_inflate_past_limit():
+    parts = {f"word/media/part{i}.xml": compressible_part(20_000, i) for i in range(10)}
+    docx = make_zip(parts).getvalue()
+    assert len(docx) < 100_000
+    source = make_zip({"resume.docx": docx}, compression=zipfile.ZIP_STORED)
+    with ResumeArchive(source, IngestLimits(max_file_bytes=100_000)) as archive:
+        results = read_all(archive)
+    assert "inflates past" in str(results["resume.docx"])
+
+
+def test_limits_are_shared_across_archives_and_plain_uploads():
+    limits = IngestLimits(max_total_bytes=1000)
+    first = make_zip({"a.pdf": b"x" * 400}, compression=zipfile.ZIP_STORED)
+    second = make_zip({"b.pdf": b"x" * 400}, compression=zipfile.ZIP_STORED)
+    with ResumeArchive(first, limits) as archive:
+        assert read_all(archive) == {"a.pdf": b"x" * 400}
+    with ResumeArchive(second, limits) as archive:
+        assert read_all(archive) == {"b.pdf": b"x" * 400}
+    with pytest.raises(ArchiveLimitError, match="total limit"):
+        LimitedUpload("c.pdf", io.BytesIO(b"x" * 400), limits).read()
+
+
+def test_plain_uploads_get_file_and_docx_checks():
+    limits = IngestLimits(max_file_bytes=1000)
+    assert LimitedUpload("a.pdf", io.BytesIO(b"resume"), limits).read() == b"resume"
+    with pytest.raises(ArchiveLimitError, match="file limit"):
+        LimitedUpload("big.pdf", io.BytesIO(b"x" * 2000), limits).read()
+    docx = make_zip({"word/document.xml": b"<w/>" * 500_000}).getvalue()
+    with pytest.raises(ArchiveLimitError, match="compression ratio"):
+        LimitedUpload("resume.docx", io.BytesIO(docx), IngestLimits()).read()
+
+
+def test_rejects_invalid_zip():
+    with pytest.raises(ArchiveLimitError):
+        ResumeArchive(io.BytesIO(b"not a zip"))
@@ -0,0 +1,26 @@
+"""Gemini request helper shared by the agents."""
+
+from __future__ import annotations
+
+from agents._gemini import generate_content
+
+
+class RecordingModel:
+    def __init__(self):
+        self.calls = []
+
+    def generate_content(self, prompt, **kwargs):
+        self.calls.append((prompt, kwargs))
+        return "response"
+
+
+def test_request_options_omitted_without_timeout():
+    model = RecordingModel()
+    assert generate_content(model, "prompt") == "response"
+    assert model.calls == [("prompt", {})]
+
+
+def test_timeout_passed_as_request_option():
+    model = RecordingModel()
+    generate_content(model, "prompt", timeout=12.5)
+    assert model.calls == [("prompt", {"request_options": {"timeout": 12.5}})]
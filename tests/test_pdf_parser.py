@@ -0,0 +1,19 @@
+"""Subprocess-isolated resume parsing."""
+
+from __future__ import annotations
+
+import multiprocessing
+
+import pytest
+
+from tools.pdf_parser import ResumeParser
+
+
+def test_parse_with_timeout_returns_parser_result():
+    assert ResumeParser.parse_with_timeout(b"not a resume", timeout=30) == "UNSUPPORTED_FILE_TYPE"
+
+
+def test_parse_with_timeout_terminates_child_on_overrun():
+    with pytest.raises(TimeoutError):
+        ResumeParser.parse_with_timeout(b"not a resume", timeout=0.001)
+    assert multiprocessing.active_children() == []
@@ -0,0 +1,198 @@
+"""Deadline, per-stage budget and cancellation behaviour of the orchestrator."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+import app
+
+# Released at teardown so abandoned "hung" stages finish instead of outliving the test.
+RELEASE = threading.Event()
+
+
+class FakeParser:
+    def __init__(self, session, timeout=None):
+        self.session = session
+        self.timeout = timeout
+
+    def run(self, source):
+        if source == b"hang":
+            # Like ResumeParser.parse_with_timeout: give up after the budget instead of leaking.
+            RELEASE.wait(5 if self.timeout is None else self.timeout)
+            raise TimeoutError("parsing exceeded budget")
+        self.session.set("resume_text", source.decode())
+
+
+class FakeSkills:
+    def __init__(self, session, request_timeout=None, use_gemini=True):
+        self.session = session
+        self.request_timeout = request_timeout
+        self.gemini_enabled = use_gemini
+
+    def run(self):
+        if self.gemini_enabled and self.session.get("resume_text") == "slow":
+            RELEASE.wait(5)
+        self.session.set("resume_features", {"skills": ["python"], "gemini": self.gemini_enabled})
+
+
+class FakeJD:
+    def __init__(self, session, request_timeout=None, use_gemini=True):
+        self.session = session
+        self.gemini_enabled = use_gemini
+
+    def run(self, jd_text):
+        self.session.set("jd_features", {"skills": ["python"], "gemini": self.gemini_enabled})
+
+
+class FakeScore:
+    def __init__(self, session, **_):
+        self.session = session
+
+    def run(self):
+        self.session.set("score_breakdown", "scored")
+
+
+class FakeReport:
+    def __init__(self, session, request_timeout=None, use_gemini=True):
+        self.session = session
+        self.enabled = use_gemini
+
+    def run(self):
+        self.session.set("report", {"summary": "narrative" if self.enabled else "fallback"})
+
+
+@pytest.fixture(autouse=True)
+def fake_agents(monkeypatch):
+    RELEASE.clear()
+    monkeypatch.setattr(app, "ResumeParserAgent", FakeParser)
+    monkeypatch.setattr(app, "SkillExtractionAgent", FakeSkills)
+    monkeypatch.setattr(app, "JobDescriptionAgent", FakeJD)
+    monkeypatch.setattr(app, "ScoringAgent", FakeScore)
+    monkeypatch.setattr(app, "ReportAgent", FakeReport)
+    yield
+    RELEASE.set()
+
+
+def test_run_pipeline_ok():
+    session = app.run_pipeline(b"good", "python")
+    assert session.get("status") == app.STATUS_OK
+    assert set(session.get("stage_status").values()) == {app.STATUS_OK}
+    assert session.get("report") == {"summary": "narrative"}
+
+
+def test_hung_stage_degrades_to_fallback():
+    session = app.run_pipeline(b"slow", "python", stage_timeouts={"skills": 0.2})
+    assert session.get("status") == app.STATUS_DEGRADED
+    assert session.get("stage_status")["skills"] == app.STATUS_DEGRADED
+    assert session.get("resume_features")["gemini"] is False
+    assert session.get("score_breakdown") == "scored"
+
+
+def test_stage_hung_until_deadline_is_still_scored():
+    session = app.run_pipeline(b"slow", "python", deadline=0.5, stage_timeouts={"skills": None})
+    stages = session.get("stage_status")
+    assert session.get("status") == app.STATUS_DEGRADED
+    assert stages["skills"] == stages["jd"] == stages["report"] == app.STATUS_DEGRADED
+    assert stages["score"] == app.STATUS_OK
+    assert session.get("score_breakdown") == "scored"
+
+
+def test_hung_parse_times_out():
+    session = app.run_pipeline(b"hang", "python", stage_timeouts={"parse": 0.2})
+    assert session.get("status") == app.STATUS_TIMED_OUT
+    assert session.get("stage_status")["parse"] == app.STATUS_TIMED_OUT
+
+
+def test_failing_fallback_marks_stage_failed(monkeypatch):
+    def broken_fallback(session):
+        raise RuntimeError("keyword extraction failed")
+
+    monkeypatch.setattr(app, "_keyword_only_skills", broken_fallback)
+    session = app.run_pipeline(b"slow", "python", stage_timeouts={"skills": 0.2})
+    assert session.get("status") == app.STATUS_FAILED
+    assert session.get("stage_status")["skills"] == app.STATUS_FAILED
+
+
+def test_process_multiple_resumes_returns_within_deadline():
+    started = time.monotonic()
+    sessions = app.process_multiple_resumes(
+        [b"good", b"hang", b"slow"], "python", deadline=0.5, stage_timeouts={"parse": None, "skills": None}
+    )
+    assert time.monotonic() - started < 2
+    assert [s.get("status") for s in sessions] == [app.STATUS_OK, app.STATUS_TIMED_OUT, app.STATUS_DEGRADED]
+
+
+def test_process_multiple_resumes_cancels_after_deadline():
+    sessions = app.process_multiple_resumes([b"good", b"good"], "python", deadline=0)
+    assert [s.get("status") for s in sessions] == [app.STATUS_CANCELLED, app.STATUS_CANCELLED]
+
+
+class Upload:
+    def __init__(self, name, data):
+        self.name = name
+        self.data = data
+
+    def read(self):
+        if isinstance(self.data, Exception):
+            raise self.data
+        return self.data
+
+
+def test_process_resume_stream_preserves_order_and_reports_read_errors():
+    uploads = [Upload("a.pdf", b"good"), Upload("b.pdf", ValueError("too big")), Upload("c.pdf", b"slow")]
+    results = app.process_resume_stream(uploads, "python", stage_timeouts={"skills": 0.2}, max_in_flight=1)
+    assert [name for name, _ in results] == ["a.pdf", "b.pdf", "c.pdf"]
+    assert [s.get("status") for _, s in results] == [app.STATUS_OK, app.STATUS_FAILED, app.STATUS_DEGRADED]
+
+
+def test_process_resume_stream_cancels_after_deadline():
+    uploads = [Upload(f"r{i}.pdf", b"hang") for i in range(6)]
+    started = time.monotonic()
+    results = app.process_resume_stream(uploads, "python", deadline=0.5, stage_timeouts={"parse": None}, max_in_flight=1)
+    assert time.monotonic() - started < 2
+    statuses = [s.get("status") for _, s in results]
+    assert statuses[0] == app.STATUS_TIMED_OUT
+    assert app.STATUS_CANCELLED in statuses
+    assert set(statuses) <= {app.STATUS_TIMED_OUT, app.STATUS_CANCELLED}
+
+
+def test_process_resume_stream_rejects_zero_in_flight():
+    with pytest.raises(ValueError):
+        app.process_resume_stream([Upload("a.pdf", b"good")], "python", max_in_flight=0)
+
+
+def test_process_resume_stream_releases_workers_when_iterator_raises():
+    def uploads():
+        yield Upload("a.pdf", b"good")
+        raise RuntimeError("archive vanished")
+
+    before = threading.active_count()
+    with pytest.raises(RuntimeError):
+        app.process_resume_stream(uploads(), "python", max_in_flight=2)
+    deadline = time.monotonic() + 2
+    while threading.active_count() > before and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert threading.active_count() <= before
+
+
+def test_timed_out_parses_leave_no_threads_behind():
+    before = threading.active_count()
+    uploads = [Upload(f"r{i}.pdf", b"hang") for i in range(5)]
+    results = app.process_resume_stream(uploads, "python", stage_timeouts={"parse": 0.1}, max_in_flight=1)
+    assert {s.get("status") for _, s in results} == {app.STATUS_TIMED_OUT}
+    assert threading.active_count() <= before
+
+
+def test_process_resume_stream_overruns_deadline_by_one_grace_period(monkeypatch):
+    def stuck_pipeline(*args):
+        RELEASE.wait(5)
+
+    monkeypatch.setattr(app, "_run_pipeline_until", stuck_pipeline)
+    uploads = [Upload(f"r{i}.pdf", b"good") for i in range(4)]
+    started = time.monotonic()
+    results = app.process_resume_stream(uploads, "python", deadline=0.2, max_in_flight=4)
+    assert time.monotonic() - started < 0.2 + app.DEADLINE_GRACE_SECONDS + 0.5
+    assert {s.get("status") for _, s in results} == {app.STATUS_TIMED_OUT}
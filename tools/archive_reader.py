@@ -0,0 +1,191 @@
+"""
+Streaming reader for zip archives of resumes.
+Members are decompressed one at a time with size and zip-bomb guards so an archive
+never has to be expanded in memory all at once. Plain uploads go through the same limits.
+"""
+
+from __future__ import annotations
+
+import io
+import logging
+import zipfile
+import zlib
+from dataclasses import dataclass
+from pathlib import PurePosixPath
+from typing import IO, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+SUPPORTED_EXTENSIONS = (".pdf", ".docx")
+MAX_FILE_BYTES = 10 * 1024 * 1024
+MAX_TOTAL_BYTES = 500 * 1024 * 1024
+MAX_MEMBERS = 1000
+MAX_COMPRESSION_RATIO = 100
+CHUNK_SIZE = 64 * 1024
+
+
+class ArchiveLimitError(ValueError):
+    """Raised when an upload or archive member breaks an ingest limit."""
+
+
+class IngestLimits:
+    """
+    Per-file, total-size and compression-ratio limits shared by every resume in one upload batch.
+    A single instance should be passed to all archives and plain uploads so the total is batch-wide.
+    """
+
+    def __init__(
+        self,
+        max_file_bytes: int = MAX_FILE_BYTES,
+        max_total_bytes: int = MAX_TOTAL_BYTES,
+        max_compression_ratio: float = MAX_COMPRESSION_RATIO,
+    ) -> None:
+        self.max_file_bytes = max_file_bytes
+        self.max_total_bytes = max_total_bytes
+        self.max_compression_ratio = max_compression_ratio
+        self.bytes_read = 0
+        self.total_exceeded = False
+
+    def check_declared(self, name: str, file_size: int, compress_size: int) -> None:
+        """Reject a zip entry from its header sizes before anything is inflated."""
+        if self.total_exceeded:
+            raise self._total_error()
+        if file_size > self.max_file_bytes:
+            raise ArchiveLimitError(f"{name} exceeds the {self.max_file_bytes} byte file limit.")
+        if compress_size and file_size / compress_size > self.max_compression_ratio:
+            raise ArchiveLimitError(f"{name} has a suspicious compression ratio.")
+
+    def read(self, name: str, stream: IO[bytes]) -> bytes:
+        """
+        Read a resume in chunks, counting actual bytes against the per-file and batch limits,
+        then vet DOCX internals. Counting real bytes means forged headers cannot bypass the limits.
+        """
+        if self.total_exceeded:
+            raise self._total_error()
+        chunks = []
+        size = 0
+        while True:
+            chunk = stream.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            size += len(chunk)
+            if size > self.max_file_bytes:
+                raise ArchiveLimitError(f"{name} exceeds the {self.max_file_bytes} byte file limit.")
+            if self.bytes_read + size > self.max_total_bytes:
+                self.total_exceeded = True
+                raise self._total_error()
+            chunks.append(chunk)
+        self.bytes_read += size
+        data = b"".join(chunks)
+        if name.lower().endswith(".docx"):
+            self._check_docx(name, data)
+        return data
+
+    def _check_docx(self, name: str, data: bytes) -> None:
+        """
+        A DOCX is itself a zip that the parser inflates fully, so its parts must fit the per-file
+        limit and ratio individually and, summed, the per-file limit and the unused batch budget.
+        Declared sizes are safe to trust here because zipfile refuses to read past them (the CRC
+        check fails).
+        """
+        try:
+            with zipfile.ZipFile(io.BytesIO(data)) as docx:
+                entries = docx.infolist()
+        except zipfile.BadZipFile as exc:
+            raise ArchiveLimitError(f"{name} is not a valid DOCX file.") from exc
+        inflated = 0
+        for entry in entries:
+            if entry.file_size > self.max_file_bytes:
+                raise ArchiveLimitError(f"{name} contains a part over the {self.max_file_bytes} byte file limit.")
+            if entry.compress_size and entry.file_size / entry.compress_size > self.max_compression_ratio:
+                raise ArchiveLimitError(f"{name} contains a part with a suspicious compression ratio.")
+            inflated += entry.file_size
+        if inflated > self.max_file_bytes:
+            raise ArchiveLimitError(f"{name} inflates past the {self.max_file_bytes} byte file limit.")
+        if inflated > self.max_total_bytes - self.bytes_read:
+            raise ArchiveLimitError(f"{name} inflates past the remaining {self.max_total_bytes} byte total budget.")
+
+    def _total_error(self) -> ArchiveLimitError:
+        return ArchiveLimitError(f"Upload exceeds the {self.max_total_bytes} byte total limit.")
+
+
+@dataclass
+class LimitedUpload:
+    """A plain (non-archive) upload whose bytes are read through the batch's ingest limits."""
+
+    name: str
+    stream: IO[bytes]
+    limits: IngestLimits
+
+    def read(self) -> bytes:
+        """Read the upload, enforcing per-file, batch-total and DOCX limits."""
+        return self.limits.read(self.name, self.stream)
+
+
+@dataclass
+class ArchiveMember:
+    """A resume inside an archive; bytes are only decompressed when read() is called."""
+
+    name: str
+    archive: "ResumeArchive"
+    info: zipfile.ZipInfo
+
+    def read(self) -> bytes:
+        """Decompress this member, enforcing per-file and batch-wide limits."""
+        return self.archive._read_member(self.info)
+
+
+class ResumeArchive:
+    """
+    Iterates the PDF/DOCX members of a zip archive lazily.
+    Declared sizes are checked up front and actual decompressed bytes are counted while
+    streaming; pass a shared IngestLimits so several archives draw on one total budget.
+    """
+
+    def __init__(
+        self,
+        source: str | IO[bytes],
+        limits: Optional[IngestLimits] = None,
+        max_members: int = MAX_MEMBERS,
+    ) -> None:
+        try:
+            self.zip = zipfile.ZipFile(source)
+        except zipfile.BadZipFile as exc:
+            raise ArchiveLimitError("Upload is not a valid zip archive.") from exc
+        self.limits = limits or IngestLimits()
+        self.max_members = max_members
+
+        entries = [info for info in self.zip.infolist() if not info.is_dir()]
+        if len(entries) > max_members:
+            self.zip.close()
+            raise ArchiveLimitError(f"Archive has {len(entries)} files; the limit is {max_members}.")
+
+    def __enter__(self) -> "ResumeArchive":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.zip.close()
+
+    def members(self) -> Iterator[ArchiveMember]:
+        """Yield supported resume files in archive order, skipping folders and OS metadata."""
+        for info in self.zip.infolist():
+            path = PurePosixPath(info.filename)
+            if info.is_dir() or path.name.startswith(".") or "__MACOSX" in path.parts:
+                continue
+            if path.suffix.lower() not in SUPPORTED_EXTENSIONS:
+                logger.info("Skipping unsupported archive member %s", info.filename)
+                continue
+            yield ArchiveMember(name=info.filename, archive=self, info=info)
+
+    def _read_member(self, info: zipfile.ZipInfo) -> bytes:
+        if info.flag_bits & 0x1:
+            raise ArchiveLimitError(f"{info.filename} is encrypted.")
+        self.limits.check_declared(info.filename, info.file_size, info.compress_size)
+        try:
+            with self.zip.open(info) as stream:
+                return self.limits.read(info.filename, stream)
+        except (zipfile.BadZipFile, zlib.error, NotImplementedError) as exc:
+            raise ArchiveLimitError(f"{info.filename} is corrupt or uses an unsupported compression method.") from exc
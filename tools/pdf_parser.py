@@ -1,8 +1,22 @@
 import io
+import multiprocessing
 import zipfile
 from docx import Document
 from PyPDF2 import PdfReader
 
+# forkserver avoids forking a multi-threaded server; spawn is the portable fallback (Windows).
+_START_METHOD = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+
+def _parse_worker(conn, file_bytes: bytes) -> None:
+    """Child-process entry point: parse and send the text (or the error) back to the parent."""
+    try:
+        conn.send((True, ResumeParser.parse(file_bytes)))
+    except Exception as exc:
+        conn.send((False, f"{type(exc).__name__}: {exc}"))
+    finally:
+        conn.close()
+
 
 class ResumeParser:
     """
@@ -41,3 +55,30 @@ class ResumeParser:
 
         # -------- INVALID FILE TYPE --------
         return "UNSUPPORTED_FILE_TYPE"
+
+    @staticmethod
+    def parse_with_timeout(file_bytes: bytes, timeout: float) -> str:
+        """
+        Parse in a child process and terminate it if it runs longer than timeout seconds,
+        so a pathological file cannot keep burning CPU or holding memory after it is abandoned.
+        Raises TimeoutError on overrun.
+        """
+        context = multiprocessing.get_context(_START_METHOD)
+        receiver, sender = context.Pipe(duplex=False)
+        process = context.Process(target=_parse_worker, args=(sender, file_bytes), daemon=True)
+        process.start()
+        sender.close()
+        try:
+            if not receiver.poll(timeout):
+                raise TimeoutError(f"parsing exceeded {timeout:.1f}s")
+            ok, result = receiver.recv()
+        except EOFError:
+            raise RuntimeError("Resume parser process exited unexpectedly.") from None
+        finally:
+            receiver.close()
+            if process.is_alive():
+                process.terminate()
+            process.join()
+        if not ok:
+            raise RuntimeError(result)
+        return result
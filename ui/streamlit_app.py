@@ -5,26 +5,46 @@ Streamlit UI for Smart Resume → Job Match AI Agent
 from __future__ import annotations
 import sys
 from pathlib import Path
-from typing import List
+from typing import Iterable, Iterator, List
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import streamlit as st
-from app import process_multiple_resumes
+from app import STATUS_DEGRADED, STATUS_OK, NamedUpload, process_resume_stream
+from tools.archive_reader import ArchiveLimitError, IngestLimits, LimitedUpload, ResumeArchive
 
 st.set_page_config(page_title="Smart Resume Match", layout="wide")
 
 st.title("Smart Resume → Job Match AI Agent")
-st.write("Upload PDF or DOCX resumes and paste a job description to generate ATS scores and a recruiter-style summary.")
+st.write("Upload PDF or DOCX resumes (or a ZIP of them) and paste a job description to generate ATS scores and a recruiter-style summary.")
 
 uploaded_resumes = st.file_uploader(
     "Upload Resumes",
-    type=["pdf", "docx"],
+    type=["pdf", "docx", "zip"],
     accept_multiple_files=True
 )
 
 jd_text = st.text_area("Paste Job Description")
 
+time_budget = st.number_input("Time budget (seconds)", min_value=10, max_value=1800, value=300, step=10)
+
+
+def iter_resumes(files: Iterable) -> Iterator[NamedUpload]:
+    """Yield plain uploads and ZIP members, all read through one batch-wide set of ingest limits."""
+    limits = IngestLimits()
+    for file in files:
+        if not file.name.lower().endswith(".zip"):
+            yield LimitedUpload(name=file.name, stream=file, limits=limits)
+            continue
+        try:
+            archive = ResumeArchive(file, limits=limits)
+        except ArchiveLimitError as exc:
+            st.error(f"{file.name}: {exc}")
+            continue
+        with archive:
+            yield from archive.members()
+
+
 if st.button("Analyze"):
 
     if not uploaded_resumes:
@@ -37,13 +57,20 @@ if st.button("Analyze"):
 
     st.success("Processing resumes… Please wait ⏳")
 
-    resume_bytes = [file.read() for file in uploaded_resumes]
-
-    sessions = process_multiple_resumes(resume_bytes, jd_text)
+    # Resumes are read lazily so ZIP archives are decompressed one member at a time.
+    results = process_resume_stream(iter_resumes(uploaded_resumes), jd_text, deadline=float(time_budget))
 
     # OUTPUT PER RESUME
-    for session, file in zip(sessions, uploaded_resumes):
-        st.markdown(f"## 📄 Results for: **{file.name}**")
+    for file_name, session in results:
+        st.markdown(f"## 📄 Results for: **{file_name}**")
+
+        status = session.get("status", STATUS_OK)
+        if status == STATUS_DEGRADED:
+            degraded = [name for name, value in session.get("stage_status", {}).items() if value == STATUS_DEGRADED]
+            st.warning(f"Partial result: {', '.join(degraded)} ran out of time and used a fallback.")
+        elif status != STATUS_OK:
+            st.error(f"Not scored ({status.replace('_', ' ')}): {session.get('error', 'unknown error')}")
+            continue
 
         score = session.get("score_breakdown")
         report = session.get("report", {})